@@ -2,15 +2,219 @@ import pathlib
 import argparse
 from _ast import ClassDef, FunctionDef, expr
 import ast
+import contextlib
+import io
+import multiprocessing
+import os
 import re
+import sys
+import tokenize
+from functools import lru_cache
 from typing import Generator, List, Optional, Tuple, Dict
 
+# Looking for comment part of the line, matches everything that appears after '#'
+# (?<!') - ensures match is not inside '' quotes
+# (?<!") - ensures match is not inside "" quotes
+# #(.*) - matches everything that appears after # symbol
+_COMMENT_RE = re.compile(r"""(?<!')(?<!")#(.*)""")
+_DEF_CLASS_RE = re.compile(r'(def|class)(\s+)(\w+)')
+
+_SNAKE_START = frozenset('abcdefghijklmnopqrstuvwxyz_')
+_SNAKE_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_')
+
+
+def split_line_to_code_comment(line: str) -> Tuple[str, str, int]:
+    """
+    Splits a line into code part and comment part.
+
+    Splits a line into a code part that contains python syntax, and a comment part that includes
+    everything that appeared after '#'. Lines without '#', or without quotes before it, are split with plain
+    string operations; the regex is used only when the '#' may be inside a string literal.
+
+    Args:
+        line: The line of code to be split.
+
+    Returns:
+        A tuple containing code part, comment part, and calculated spaces between them.
+    """
+    hash_index = line.find('#')
+    if hash_index == -1:
+        return line.rstrip(), '', 0
+    if "'" in line[:hash_index] or '"' in line[:hash_index]:
+        comment_match = _COMMENT_RE.search(line)
+        if not comment_match:
+            return line.rstrip(), '', 0
+        hash_index = comment_match.start()
+    code_part = line[:hash_index].rstrip()
+    comment_part = line[hash_index:]
+    # getting spaces between code and comment part by subtracting length of the code part from '#' position
+    spaces_between_code_comment = hash_index - len(code_part)
+
+    return code_part, comment_part, spaces_between_code_comment
+
+
+def get_indentation(line: str) -> int:
+    """
+    Calculates the number of spaces used before the line as indentation.
+
+    Args:
+        line: The line of code.
+
+    Returns:
+        The number of spaces used as indentation.
+    """
+    return len(line) - len(line.lstrip(' '))
+
+
+def invalid_length(length: int) -> Optional[str]:
+    """
+    Check if the line length is greater than 79 characters.
+
+    Args:
+        length: The length of the line.
+
+    Returns:
+        The issue message if the line length is greater than 79, None otherwise.
+    """
+    if length > 79:
+        return 'S001 Too long'
+
+
+def invalid_indentation(indentation: int) -> Optional[str]:
+    """
+    Check if indentation of line is a multiple of four.
+
+    Args:
+        indentation: The number of spaces used as indentation.
+
+    Returns:
+        The issue message if the line indentation is not multiple of four, None otherwise.
+    """
+    if indentation % 4 != 0:
+        return 'S002 Indentation is not a multiple of four'
+
+
+def ends_with_semicolon(code_part: str) -> Optional[str]:
+    """
+    Checks if the code part of the line ends with a semicolon.
+
+    Args:
+        code_part: The code part of the line, without trailing whitespace.
+
+    Returns:
+        The issue message if the code part of the line ends with semicolon, None otherwise.
+    """
+    if code_part.endswith(';'):
+        return 'S003 Unnecessary semicolon'
+
+
+def invalid_inline_comment_spacing(code_part: str, comment_part: str, code_comment_spaces: int) -> Optional[str]:
+    """
+    Checks if there is at least two spaces between code part of the line and inline comment.
+
+    Args:
+        code_part: The code part of the line, without trailing whitespace.
+        comment_part: The comment part of the line.
+        code_comment_spaces: The number of spaces between the code and comment parts.
+
+    Returns:
+        The issue message if there is at least two spaces between code part of the line and inline comment,
+        None otherwise.
+    """
+    if code_part and comment_part and code_comment_spaces < 2:
+        return 'S004 At least two spaces required before inline comments'
+
+
+def todo_in_comment(comment_part: str) -> Optional[str]:
+    """
+    Checks if TODO appears in the comment part of the line.
+
+    Args:
+        comment_part: The comment part of the line.
+
+    Returns:
+        The alert message if there is a TODO in the comment part, otherwise None.
+    """
+    # common spellings are checked first to avoid allocating an uppercased copy of the comment
+    if 'TODO' in comment_part or 'todo' in comment_part or 'TODO' in comment_part.upper():
+        return 'S005 TODO found'
+
+
+def invalid_preceding_blanklines(preceding_blank_lines: int) -> Optional[str]:
+    """
+    Checks if there are more than two blank lines used before this line.
+
+    Args:
+        preceding_blank_lines: The number of blank lines preceding the line.
+
+    Returns:
+        Returns an issue message if there are more than two blank lines used before this line,
+        otherwise returns None.
+    """
+    if preceding_blank_lines > 2:
+        return 'S006 More than two blank lines used before this line'
+
+
+def invalid_spaces_def_class_construction(code_part: str) -> Optional[str]:
+    """
+    Checks if there is exactly one space between key word def | class and the name.
+
+    Args:
+        code_part: The code part of the line, without trailing whitespace.
+
+    Returns:
+        Returns an issue message if there are too many spaces after 'def' or 'class' keywords,
+        otherwise returns None
+    """
+    # plain substring tests are much cheaper than the regex and rule out most of the lines
+    if 'def' not in code_part and 'class' not in code_part:
+        return None
+    match = _DEF_CLASS_RE.search(code_part)
+    if match:
+        construct = match.group(1)
+        spaces = len(match.group(2))
+        if spaces > 1:
+            return f'S007 Too many spaces after {construct}'
+
+
+def get_line_issues(line: str, preceding_blank_lines: int = 0) -> List[str]:
+    """
+    Get a list of a PEP8 styling issues found in the line.
+
+    Splits the line into its code and comment parts once and passes them to the line checks, so analyzing a line
+    does not allocate anything besides the parts and the returned list.
+
+    Args:
+        line: The line of code.
+        preceding_blank_lines: The number of blank lines preceding the line. By default, is 0.
+
+    Returns:
+        A list of string messages alerting of the occurred issue.
+    """
+    code_part, comment_part, code_comment_spaces = split_line_to_code_comment(line)
+    line_pep_issues = []
+    for issue in (invalid_length(len(line)), invalid_indentation(get_indentation(line)),
+                  ends_with_semicolon(code_part)):
+        if issue:
+            line_pep_issues.append(issue)
+    # comment related checks can only fire if the line has a comment part
+    if comment_part:
+        for issue in (invalid_inline_comment_spacing(code_part, comment_part, code_comment_spaces),
+                      todo_in_comment(comment_part)):
+            if issue:
+                line_pep_issues.append(issue)
+    for issue in (invalid_preceding_blanklines(preceding_blank_lines),
+                  invalid_spaces_def_class_construction(code_part)):
+        if issue:
+            line_pep_issues.append(issue)
+    return line_pep_issues
+
 
 class Line:
     """Represents a line of code for static code analysis.
 
-    Represents a line of code for static code analysis. Implements validation functions
-    that validate if provided line follows PEP8 styling guide rules.
+    Represents a line of code for static code analysis. Wraps the module-level line checks, which the file analyzer
+    calls directly, to validate if provided line follows PEP8 styling guide rules.
 
     Attributes:
         line (str): A string representing a line of code.
@@ -18,12 +222,15 @@ class Line:
         preceding_blank_lines (int): The number of blank lines preceding line of code. By default, is 0.
         length (int): The length of the line.
         indentation (int): The indentation level of the line.
-        code_part (str): The code part of the line.
+        code_part (str): The code part of the line, without trailing whitespace.
         comment_part (str): The comment part of the line.
         code_comment_spaces (int): The number of spaces between the code and comment parts.
 
     """
 
+    __slots__ = ('line', 'line_index', 'preceding_blank_lines', 'length', 'indentation', 'code_part',
+                 'comment_part', 'code_comment_spaces')
+
     def __init__(self, line: str, line_index: int = 1, preceding_blank_lines: int = 0) -> None:
         """
         Initialize a Line object.
@@ -37,9 +244,8 @@ class Line:
         self.line_index = line_index
         self.preceding_blank_lines = preceding_blank_lines
         self.length = len(line)
-        self.indentation = self.get_indentation(line)
-        self.code_part, self.comment_part, self.code_comment_spaces = self.split_line_to_code_comment(
-            self.line)
+        self.indentation = get_indentation(line)
+        self.code_part, self.comment_part, self.code_comment_spaces = split_line_to_code_comment(self.line)
 
     def get_issues(self) -> List:
         """
@@ -49,15 +255,7 @@ class Line:
             A list of string messages alerting of the occurred issue.
 
         """
-        line_pep_issues = [self.invalid_length(),
-                           self.invalid_indentation(),
-                           self.ends_with_semicolon(),
-                           self.invalid_inline_comment_spacing(),
-                           self.todo_in_comment(),
-                           self.invalid_preceding_blanklines(),
-                           self.invalid_spaces_def_class_construction()
-                           ]
-        return list(filter(bool, line_pep_issues))
+        return get_line_issues(self.line, self.preceding_blank_lines)
 
     def invalid_length(self) -> Optional[str]:
         """
@@ -66,8 +264,7 @@ class Line:
         Returns:
             The issue message if the line length is greater than 79, None otherwise.
         """
-        if self.length > 79:
-            return 'S001 Too long'
+        return invalid_length(self.length)
 
     def invalid_indentation(self) -> Optional[str]:
         """
@@ -76,8 +273,7 @@ class Line:
         Returns:
             The issue message if the line indentation is not multiple of four, None otherwise.
         """
-        if self.indentation % 4 != 0:
-            return 'S002 Indentation is not a multiple of four'
+        return invalid_indentation(self.indentation)
 
     def ends_with_semicolon(self) -> Optional[str]:
         """
@@ -86,8 +282,7 @@ class Line:
         Returns:
             The issue message if the code part of the line ends with semicolon, None otherwise.
         """
-        if self.code_part.rstrip().endswith(';'):
-            return 'S003 Unnecessary semicolon'
+        return ends_with_semicolon(self.code_part)
 
     def invalid_inline_comment_spacing(self) -> Optional[str]:
         """
@@ -97,8 +292,7 @@ class Line:
             The issue message if there is at least two spaces between code part of the line and inline comment,
             None otherwise.
         """
-        if self.code_part and self.comment_part and self.code_comment_spaces < 2:
-            return 'S004 At least two spaces required before inline comments'
+        return invalid_inline_comment_spacing(self.code_part, self.comment_part, self.code_comment_spaces)
 
     def todo_in_comment(self) -> Optional[str]:
         """
@@ -107,8 +301,7 @@ class Line:
         Returns:
             The alert message if there is a TODO in the comment part, otherwise None.
         """
-        if 'TODO' in self.comment_part.upper():
-            return 'S005 TODO found'
+        return todo_in_comment(self.comment_part)
 
     def invalid_preceding_blanklines(self) -> Optional[str]:
         """
@@ -118,8 +311,7 @@ class Line:
             Returns an issue message if there are more than two blank lines used before this line,
             otherwise returns None.
         """
-        if self.preceding_blank_lines > 2:
-            return 'S006 More than two blank lines used before this line'
+        return invalid_preceding_blanklines(self.preceding_blank_lines)
 
     def invalid_spaces_def_class_construction(self) -> Optional[str]:
         """
@@ -129,55 +321,75 @@ class Line:
             Returns an issue message if there are too many spaces after 'def' or 'class' keywords,
             otherwise returns None
         """
-        match = re.search(r'(def|class)\s+(\w+)', self.code_part)
-        if match:
-            construct = match.group(1)
-            name = match.group(2)
-            spaces = len(match.group(0)) - len(construct) - len(name)
-            if spaces > 1:
-                return f'S007 Too many spaces after {construct}'
+        return invalid_spaces_def_class_construction(self.code_part)
 
-    @staticmethod
-    def split_line_to_code_comment(line: str) -> Tuple[str, str, int]:
-        """
-        Splits a line into code part and comment part.
+    # line splitting helpers live at module level; kept as static methods for callers using the Line class
+    split_line_to_code_comment = staticmethod(split_line_to_code_comment)
+    get_indentation = staticmethod(get_indentation)
 
-        Using regex spits a line into a code part that contains python syntax, and a comment part that includes
-        everything that appeared after '#'.
 
-        Args:
-            line: The line of code to be split.
+@lru_cache(maxsize=4096)
+def is_camelcase(name: str) -> bool:
+    """
+    Checks if a name follows the CamelCase convention.
 
-        Returns:
-            A tuple containing code part, comment part, and calculated spaces between them.
-        """
-        # Looking for comment part of the line, matches everything that appears after '#'
-        # (?<!') - ensures match is not inside '' quotes
-        # (?<!") - ensures match is not inside "" quotes
-        # #(.*) - matches everything that appears after # symbol
-        comment_match = re.search(r"""(?<!')(?<!")#(.*)""", line)
-        comment_part = comment_match.group() if comment_match else ''
-        # getting code_part by right stripping line of the comment part
-        code_part = line.rstrip(comment_part).rstrip()
-        # getting spaces between code and comment part by subtracting length form line
-        spaces_between_code_comment = len(
-            line) - len(code_part) - len(comment_part)
-
-        return code_part, comment_part, spaces_between_code_comment
+    Args:
+        name: The name to check.
 
-    @staticmethod
-    def get_indentation(line: str) -> int:
-        """
-        Calculates the number of spaces used before the line as indentation.
+    Returns:
+        True if the name follows the CamelCase convention, False otherwise.
+    """
+    return bool(name) and name[0].isupper() and name.isalnum()
 
-        Args:
-            line: The line of code.
 
-        Returns:
-            The number of spaces used as indentation.
-        """
-        match = re.match(r'^( )*', line)
-        return len(match.group())
+@lru_cache(maxsize=4096)
+def is_snakecase(name: str) -> bool:
+    """
+    Checks if a name follows the snake_case convention.
+
+    Args:
+        name: The name to check.
+
+    Returns:
+        True if the name follows the snake_case convention, False otherwise.
+    """
+    return bool(name) and name[0] in _SNAKE_START and all(char in _SNAKE_CHARS for char in name)
+
+
+def invalid_arg_var_names(arg_name=None, var_name=None) -> Optional[str]:
+    """
+    Checks if argument name or variable name follows snake_case style.
+
+    Checks if argument name or variable name follows snake_case style. Checks or argument or variable name
+    depends on which one is provided (default - None).
+    Although it follows the same styling rule it returns different issue message.
+
+    Args:
+        arg_name: The name of the argument to check. Default - None.
+        var_name: The name of the variable to check. Default - None.
+
+    Returns:
+
+    """
+    if arg_name and not is_snakecase(arg_name):
+        return f"S010 Argument name {arg_name} should be snake_case"
+    if var_name and not is_snakecase(var_name):
+        return f"S011 Variable {var_name} should be snake_case"
+
+
+def is_mutable(items: List[expr]) -> Optional[str]:
+    """
+    Checks if any default argument for function/method is of a mutable type.
+
+    Args:
+        items: The collection of default arguments to check.
+
+    Returns:
+        An issue message if any of the arguments is of a mutable type, otherwise None.
+    """
+    for item in items:
+        if isinstance(item, (ast.Dict, ast.List, ast.Set)):
+            return f"S012 The default argument value is mutable"
 
 
 class ASTNodeAnalyzer(ast.NodeVisitor):
@@ -192,15 +404,18 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
     Attributes:
          lineno_to_issues_map (Dict[int, List[str]]): A dictionary that maps line numbers to a list of issue messages
          that occurred in that line. Each line number may have multiple issues associated with it.
+         function_depth (int): The number of FunctionDef nodes enclosing the currently visited node.
     """
 
     def __init__(self) -> None:
         """
         Initializes the ASTNodeAnalyzer object.
 
-        This method initializes the `lineno_to_issues_map` attribute as an empty dictionary.
+        This method initializes the `lineno_to_issues_map` attribute as an empty dictionary
+        and the `function_depth` counter as 0.
         """
         self.lineno_to_issues_map = {}  # Line index: [msg1, msg2, msg5]
+        self.function_depth = 0
 
     def visit_ClassDef(self, node: ClassDef) -> None:
         """
@@ -223,7 +438,7 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
 
         Visits a FunctionDef node in AST and checks if names of classes follow snake_case style naming.
         After checking and adding issue msg to the list, calls generic_visit method to visit and perform the analysis
-        on all child nodes of the node.
+        on all child nodes of the node. Variables assigned in the body are checked by visit_Name during that visit.
 
         Args:
             node : The instance of FunctionDef node to analyze.
@@ -232,33 +447,42 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
         self.add_issue_to_list(
             node.lineno, self.invalid_function_name(node.name))
         # analyze arguments of function
+        add_issue, check_name = self.add_issue_to_list, invalid_arg_var_names
         for arg in node.args.args:
-            self.add_issue_to_list(node.lineno,
-                                   self.invalid_arg_var_names(arg_name=arg.arg))
-        # analyzing body of the function
-        for func_child_node in ast.walk(node):
-            if isinstance(func_child_node, ast.Name) and isinstance(func_child_node.ctx, ast.Store):
-                self.add_issue_to_list(
-                    func_child_node.lineno,
-                    self.invalid_arg_var_names(
-                        var_name=func_child_node.id)
-                )
+            add_issue(node.lineno, check_name(arg_name=arg.arg))
         # analyze default types
         self.add_issue_to_list(
-            node.lineno, self.is_mutable(node.args.defaults))
+            node.lineno, is_mutable(node.args.defaults))
 
+        self.function_depth += 1
         self.generic_visit(node)
+        self.function_depth -= 1
+
+    def visit_Name(self, node: ast.Name) -> None:
+        """
+        Visits a Name node in AST and performs analysis.
+
+        Checks if names of variables assigned inside a function body follow snake_case style naming.
+        Assignments outside of any function are not checked.
+
+        Args:
+            node : The instance of Name node to analyze.
+        """
+        # ast contexts are never subclassed, so an identity check of the type is enough
+        if self.function_depth and type(node.ctx) is ast.Store:
+            self.add_issue_to_list(node.lineno,
+                                   invalid_arg_var_names(var_name=node.id))
 
     def print_issues(self) -> None:
         """
         Prints all the line issues stored in the `lineno_to_issues_map`.
 
         This method iterates over each line index in the `lineno_to_issues_map` and prints the associated issue messages
-        for that line.
+        for that line, writing all of them to stdout at once.
         """
-        for line_index, msgs in self.lineno_to_issues_map.items():
-            for msg in msgs:
-                print(f'Line {line_index}: {msg}')
+        sys.stdout.write(''.join(f'Line {line_index}: {msg}\n'
+                                 for line_index, msgs in self.lineno_to_issues_map.items()
+                                 for msg in msgs))
 
     def get_line_issues(self, line_index: int) -> Optional[List[str]]:
         """
@@ -298,67 +522,11 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
         if issue:
             self.lineno_to_issues_map.setdefault(lineno, []).append(issue)
 
-    @staticmethod
-    def invalid_arg_var_names(arg_name=None, var_name=None) -> Optional[str]:
-        """
-        Checks if argument name or variable name follows snake_case style.
-
-        Checks if argument name or variable name follows snake_case style. Checks or argument or variable name
-        depends on which one is provided (default - None).
-        Although it follows the same styling rule it returns different issue message.
-
-        Args:
-            arg_name: The name of the argument to check. Default - None.
-            var_name: The name of the variable to check. Default - None.
-
-        Returns:
-
-        """
-        if arg_name and not ASTNodeAnalyzer.is_snakecase(arg_name):
-            return f"S010 Argument name {arg_name} should be snake_case"
-        if var_name and not ASTNodeAnalyzer.is_snakecase(var_name):
-            return f"S011 Variable {var_name} should be snake_case"
-
-    @staticmethod
-    def is_mutable(items: List[expr]) -> Optional[str]:
-        """
-        Checks if any default argument for function/method is of a mutable type.
-
-        Args:
-            items: The collection of default arguments to check.
-
-        Returns:
-            An issue message if any of the arguments is of a mutable type, otherwise None.
-        """
-        for item in items:
-            if any([isinstance(item, ast.Dict), isinstance(item, ast.List), isinstance(item, ast.Set)]):
-                return f"S012 The default argument value is mutable"
-
-    @staticmethod
-    def is_camelcase(name: str) -> bool:
-        """
-        Checks if a name follows the CamelCase convention.
-
-        Args:
-            name: The name to check.
-
-        Returns:
-            True if the name follows the CamelCase convention, False otherwise.
-        """
-        return True if re.match(r'^([A-Z]+[a-z]*)+', name) else False
-
-    @staticmethod
-    def is_snakecase(name: str) -> bool:
-        """
-        Checks if a name follows the snake_case convention.
-
-        Args:
-            name: The name to check.
-
-        Returns:
-            True if the name follows the snake_case convention, False otherwise.
-        """
-        return True if re.match(r'^[a-z_]+[\da-z_]*', name) else False
+    # validation helpers live at module level; kept as static methods for callers using the analyzer class
+    invalid_arg_var_names = staticmethod(invalid_arg_var_names)
+    is_mutable = staticmethod(is_mutable)
+    is_camelcase = staticmethod(is_camelcase)
+    is_snakecase = staticmethod(is_snakecase)
 
     @staticmethod
     def invalid_classname(classname: str) -> Optional[str]:
@@ -371,7 +539,7 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
         Returns:
             An issue message if the class name is invalid, otherwise None.
         """
-        if not ASTNodeAnalyzer.is_camelcase(classname):
+        if not is_camelcase(classname):
             return f"S008 Class name {classname} should use CamelCase"
 
     @staticmethod
@@ -385,7 +553,7 @@ class ASTNodeAnalyzer(ast.NodeVisitor):
         Returns:
             An issue message if the function name is invalid, otherwise None.
         """
-        if not ASTNodeAnalyzer.is_snakecase(function_name):
+        if not is_snakecase(function_name):
             return f"S009 Function name {function_name} should use snake_case"
 
 
@@ -395,9 +563,8 @@ class FileStaticCodeAnalyzer:
 
         Attributes:
              path: The string path to the file.
-             line_index: The current index of line being analyzed.
-             blank_lines_before: The number of blank lines before current line.
              ast_analyzer: An instance of ASTNodeAnalyzer for analyzing Abstract Tree Syntax nodes.
+             output_lines: The issue messages collected for the file, written to stdout on exit.
         """
 
     def __init__(self, _path: str) -> None:
@@ -408,8 +575,6 @@ class FileStaticCodeAnalyzer:
             _path: The path to the file to be analyzed.
         """
         self.path = _path
-        self.line_index = 1
-        self.blank_lines_before = 0
         self.ast_analyzer = ASTNodeAnalyzer()
 
     def __enter__(self):
@@ -419,12 +584,13 @@ class FileStaticCodeAnalyzer:
         Returns:
             FileStaticCodeAnalyzer: The FileStaticCodeAnalyzer instance.
         """
-        self.file = open(self.path, 'r')
+        self.file = open(self.path, 'rb')
+        self.output_lines = []
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Context manager exit point for closing the file and performing cleanup.
+        Context manager exit point for closing the file and writing the collected issues to stdout at once.
 
         Args:
             exc_type: The exception type, if an exception occurred.
@@ -435,62 +601,69 @@ class FileStaticCodeAnalyzer:
             bool: False to indicate that any exceptions should propagate.
         """
         self.file.close()
-        # Perform cleanup or resource release
+        sys.stdout.write(''.join(self.output_lines))
         return False
 
-    def log_issues(self, issues: List[str]) -> None:
+    def log_issues(self, line_index: int, issues: List[str]) -> None:
         """
-        Prints the list of issues messages that occurred in the analyzed line.
+        Collects the list of issues messages that occurred in the analyzed line for printing.
 
-        Prints the list of issues that occurred in the analyzed line in the template:
+        Collects the list of issues that occurred in the analyzed line in the template:
         path/of/analyzed/file.py: Line 1: S001 Issue 1
         path/of/analyzed/file.py: Line 1: S002 Issue 2
 
         Args:
+            line_index: The index of the analyzed line.
             issues: List of issues messages that occurred in the analyzed line.
         """
-        msg_template = f"{self.path}: Line {self.line_index}: %msg%"
         for issue in issues:
-            print(msg_template.replace('%msg%', f'{issue}'))
+            self.output_lines.append(f"{self.path}: Line {line_index}: {issue}\n")
 
     def analyze_file(self) -> None:
         """
         Handles the logic of analyzing the file. Creates AST tree, reads through lines of file.
 
         Creates Abstract Syntax Tree of analyzed file and calls the AST analyzer to visit the tree for the issues.
-        Resets the file position to 0 to loop through the lines of the file to pass the for further analysis.
-        """
-        tree = ast.parse(self.file.read())
+        The file is read once as bytes, which the parser decodes itself following the source encoding declaration.
+        The same source is decoded once and split into lines on universal newlines, so line indexes match the AST
+        line numbers, and the lines are analyzed in a single pass. Blank and whitespace-only lines are only counted,
+        every other line is checked and its issues are collected together with the issues found for it while
+        analyzing the AST.
+        """
+        source = self.file.read()
+        tree = ast.parse(source)
         self.ast_analyzer.visit(tree)
-        self.file.seek(0)
-        for line in self.file:
-            line = line.rstrip('\n')
-            self.line_analyze_handler(line)
-            self.line_index += 1
-
-    def line_analyze_handler(self, line: str) -> None:
-        """
-        Handles the logic of analyzing the line of the file, and passes the list of issues to print.
+        ast_issues_map = self.ast_analyzer.lineno_to_issues_map
+        blank_lines_before = 0
+        for line_index, line in enumerate(split_source_lines(source), 1):
+            if not line or line.isspace():
+                # if the line is blank (or whitespace only) skips the analysis and updates blank lines count
+                blank_lines_before += 1
+                continue
+            self.log_issues(line_index, get_line_issues(line, blank_lines_before))
+            ast_issues = ast_issues_map.get(line_index)
+            if ast_issues:
+                self.log_issues(line_index, ast_issues)
+            blank_lines_before = 0
+
+
+def split_source_lines(source: bytes) -> List[str]:
+    """
+    Decodes the raw source code and splits it into lines the same way the parser numbers them.
 
-        Creates an instance of the Line class, retrieves the list of issues of the line and prints them to the console.
-        Retrieves the list of issues that occurred in this line while analyzing the AST.
-        Increases the blank lines counter if encounters a blank line, and resets it to 0 if otherwise.
+    The source is decoded with the encoding detected by tokenize.detect_encoding, which follows the encoding
+    declaration and the UTF-8 BOM like the parser does. Only universal newlines ('\\n', '\\r\\n' and '\\r') end a
+    line. str.splitlines also breaks on characters such as form feeds or '\\u2028', which would shift the index of
+    every following line away from the AST line numbers.
 
-        Args:
-            line: The line of the analyzed file.
-        """
-        if line:
-            line_obj = Line(line, self.line_index, self.blank_lines_before)
-            line_issues = line_obj.get_issues()
-            self.log_issues(line_issues)
-            ast_issues = self.ast_analyzer.get_line_issues(self.line_index)
-            if ast_issues is not None:
-                self.log_issues(ast_issues)
-            self.blank_lines_before = 0
+    Args:
+        source: The raw source code of the analyzed file.
 
-        else:
-            # if the line is blank skips the analysis and updates blank lines count
-            self.blank_lines_before += 1
+    Returns:
+        The lines of the source, without the line endings.
+    """
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+    return [line.rstrip('\n') for line in io.StringIO(source.decode(encoding), newline=None)]
 
 
 def get_path_from_console() -> str:
@@ -512,6 +685,9 @@ def get_py_paths(_path: str) -> Generator[pathlib.Path, None, None]:
 
     Yields all the .py files. If the path points to .py yields only the file.
     If the path points to a directory yields paths to all .py files that exist in the directory and all subdirectories.
+    Directories are walked with os.scandir, which reads the entry types from the directory listing instead of calling
+    stat for every entry. Like Path.rglob, symlinked directories are not followed and unreadable directories are
+    skipped.
 
     Args:
         _path: A string representing a path to file/directory.
@@ -522,16 +698,52 @@ def get_py_paths(_path: str) -> Generator[pathlib.Path, None, None]:
     path_obj = pathlib.Path(_path)
     if path_obj.is_file():
         yield path_obj
-    else:
-        yield from path_obj.rglob('*.py')
-
-
-if __name__ == '__main__':
+        return
+    dirs_to_scan = [str(path_obj)]
+    while dirs_to_scan:
+        try:
+            entries = os.scandir(dirs_to_scan.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs_to_scan.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield pathlib.Path(entry.path)
+
+
+def analyze_path(path_str: str) -> str:
+    """
+    Analyzes a single .py file and returns the issue messages it would print.
 
-    user_path = get_path_from_console()
+    The printed output of the analyzer is captured, so files analyzed in worker processes can be written to stdout
+    by the parent process without interleaving.
 
-    for path in get_py_paths(user_path):
-        path_str = str(path)
+    Args:
+        path_str: A string representing a path to the .py file.
 
+    Returns:
+        The issue messages of the file, one per line.
+    """
+    with contextlib.redirect_stdout(io.StringIO()) as output:
         with FileStaticCodeAnalyzer(path_str) as analyzer:
             analyzer.analyze_file()
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+
+    user_path = get_path_from_console()
+    paths = [str(path) for path in get_py_paths(user_path)]
+
+    if len(paths) > 1:
+        with multiprocessing.Pool() as pool:
+            chunksize = max(1, len(paths) // (4 * (os.cpu_count() or 1)))
+            # imap keeps the output in the same order as the sequential run
+            for file_output in pool.imap(analyze_path, paths, chunksize=chunksize):
+                sys.stdout.write(file_output)
+    else:
+        for path_str in paths:
+            with FileStaticCodeAnalyzer(path_str) as analyzer:
+                analyzer.analyze_file()